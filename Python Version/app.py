@@ -0,0 +1,484 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+from concurrent.futures import ThreadPoolExecutor
+from database import Database
+import json
+import os
+
+class BaseDialog(tk.Toplevel):
+    def __init__(self, parent, title, size="400x200"):
+        super().__init__(parent)
+        self.title(title)
+        self.geometry(size)
+        self.grab_set()
+
+        # Let the entry column grow with the window
+        self.columnconfigure(1, weight=1)
+        self.rowconfigure(1, weight=1)
+
+class NoteDialog(BaseDialog):
+    def __init__(self, parent, title, app, note=None, is_readonly=True, on_edit=None, on_save=None):
+        super().__init__(parent, title, "600x400")
+        self.note = note
+        self.app = app
+
+        # Lock the note for editing before showing the editor
+        if not is_readonly and note:
+            can_edit, editor = self.app.db.set_note_editing_status(note[0], self.app.user_id.get())
+            if not can_edit:
+                messagebox.showwarning(
+                    "Note Locked",
+                    f"This note is currently being edited by {editor}. Please try again later."
+                )
+                self.destroy()
+                return
+
+        # Title field
+        ttk.Label(self, text="Title:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        self.title_entry = ttk.Entry(self, width=50)
+        self.title_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5, pady=5)
+
+        # Content field
+        ttk.Label(self, text="Content:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
+        self.content_text = tk.Text(self, wrap=tk.WORD, width=50, height=15)
+        self.content_text.grid(row=1, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
+
+        # Populate with the existing note, if any
+        if note:
+            self.title_entry.insert(0, note[3])
+            self.content_text.insert(1.0, note[4] or "")
+
+        # Read-only mode disables the fields
+        if is_readonly:
+            self.title_entry.configure(state='readonly')
+            self.content_text.configure(state='disabled')
+
+        # Buttons
+        button_frame = ttk.Frame(self)
+        button_frame.grid(row=2, column=0, columnspan=2, pady=10)
+
+        if is_readonly:
+            if on_edit:
+                ttk.Button(button_frame, text="Edit", command=on_edit).pack(side=tk.LEFT, padx=5)
+            ttk.Button(button_frame, text="Close", command=self.destroy).pack(side=tk.LEFT, padx=5)
+        else:
+            ttk.Button(button_frame, text="Save", command=on_save).pack(side=tk.LEFT, padx=5)
+
+        # Release the editing lock if the window is closed
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def on_close(self):
+        # Clear the editing status if we were editing
+        if self.note and not self.title_entry.cget('state') == 'readonly':
+            self.app.db.clear_note_editing_status(self.note[0], self.app.user_id.get())
+        self.destroy()
+
+class NotesApp:
+    def __init__(self, root, settings_file='user_settings.json'):
+        self.root = root
+        self.root.title("Troubleshooting Notes")
+
+        # Load user settings before anything else
+        self.settings_file = settings_file
+        self.load_user_settings()
+
+        # Shared database on the network drive
+        db_path = 'P:\\EMS Testing & Repair\\Troubleshooting App\\dist\\database\\notes.db'
+        self.db = Database(db_path)
+
+        # Companies and boards rarely change between GUI events, so cache
+        # them instead of querying on every keystroke
+        self._companies_cache = None
+        self._boards_cache = {}
+        self._company_change_job = None
+
+        # Worker pool so slow queries (network share, busy waits) don't
+        # freeze the Tk main loop
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        self._notes_future = None
+
+        self.setup_gui()
+        self.refresh_companies()
+
+    def load_user_settings(self):
+        if os.path.exists(self.settings_file):
+            with open(self.settings_file, 'r') as f:
+                self.settings = json.load(f)
+        else:
+            self.settings = {
+                'last_user': ''
+            }
+            self.save_user_settings()
+
+    def save_user_settings(self):
+        # Write to a temp file and swap it in so a crash mid-write can't
+        # leave a truncated settings file behind
+        tmp_file = self.settings_file + '.tmp'
+        with open(tmp_file, 'w') as f:
+            # Compact separators: fewer bytes to encode and write
+            json.dump(self.settings, f, separators=(',', ':'))
+        os.replace(tmp_file, self.settings_file)
+
+    def setup_gui(self):
+        # Allow the window to be resized
+        self.root.resizable(True, True)
+
+        # Main container
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        # User ID
+        ttk.Label(main_frame, text="User ID:").grid(row=0, column=0, sticky=tk.W)
+        self.user_id = ttk.Entry(main_frame)
+        self.user_id.grid(row=0, column=1, sticky=(tk.W, tk.E))
+        self.user_id.insert(0, self.settings.get('last_user', ''))
+
+        # Company selection
+        ttk.Label(main_frame, text="Company:").grid(row=2, column=0, sticky=tk.W)
+        company_frame = ttk.Frame(main_frame)
+        company_frame.grid(row=2, column=1, columnspan=2, sticky=(tk.W, tk.E))
+        company_frame.columnconfigure(0, weight=1)
+
+        self.company_var = tk.StringVar()
+        self.company_combo = ttk.Combobox(company_frame, textvariable=self.company_var)
+        self.company_combo.grid(row=0, column=0, sticky=(tk.W, tk.E))
+
+        company_buttons_frame = ttk.Frame(company_frame)
+        company_buttons_frame.grid(row=0, column=1, sticky=(tk.W, tk.E))
+        ttk.Button(company_buttons_frame, text="Add", command=self.add_company_dialog).pack(side=tk.LEFT, padx=2)
+        ttk.Button(company_buttons_frame, text="Delete", command=self.delete_company_dialog).pack(side=tk.LEFT, padx=2)
+
+        # Board selection
+        ttk.Label(main_frame, text="Board:").grid(row=3, column=0, sticky=tk.W)
+        board_frame = ttk.Frame(main_frame)
+        board_frame.grid(row=3, column=1, columnspan=2, sticky=(tk.W, tk.E))
+        board_frame.columnconfigure(0, weight=1)
+
+        self.board_var = tk.StringVar()
+        self.board_combo = ttk.Combobox(board_frame, textvariable=self.board_var)
+        self.board_combo.grid(row=0, column=0, sticky=(tk.W, tk.E))
+
+        board_buttons_frame = ttk.Frame(board_frame)
+        board_buttons_frame.grid(row=0, column=1, sticky=(tk.W, tk.E))
+        ttk.Button(board_buttons_frame, text="Add", command=self.add_board_dialog).pack(side=tk.LEFT, padx=2)
+        ttk.Button(board_buttons_frame, text="Delete", command=self.delete_board_dialog).pack(side=tk.LEFT, padx=2)
+
+        # Notes area
+        notes_frame = ttk.LabelFrame(main_frame, text="Notes", padding="5")
+        notes_frame.grid(row=4, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S))
+        notes_frame.columnconfigure(0, weight=1)
+        notes_frame.rowconfigure(0, weight=1)
+
+        # Notes list
+        self.notes_tree = ttk.Treeview(notes_frame, columns=('Title', 'Created By', 'Last Modified By', 'Date'), show='headings')
+        for col in ('Title', 'Created By', 'Last Modified By', 'Date'):
+            self.notes_tree.heading(col, text=col)
+        self.notes_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        # Column sizing
+        self.notes_tree.column('Title', width=200, minwidth=100)
+        self.notes_tree.column('Created By', width=100, minwidth=80)
+        self.notes_tree.column('Last Modified By', width=100, minwidth=80)
+        self.notes_tree.column('Date', width=150, minwidth=100)
+
+        scrollbar = ttk.Scrollbar(notes_frame, orient=tk.VERTICAL, command=self.notes_tree.yview)
+        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.notes_tree.configure(yscrollcommand=scrollbar.set)
+
+        # Note action buttons
+        button_frame = ttk.Frame(notes_frame)
+        button_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E))
+        for text, command in (
+            ("New Note", self.new_note_dialog),
+            ("Edit Note", lambda: self.edit_note_dialog(is_new=False)),
+            ("Delete Note", self.delete_note)
+        ):
+            ttk.Button(button_frame, text=text, command=command).pack(side=tk.LEFT, padx=5)
+
+        # Let the main area grow with the window
+        self.root.grid_rowconfigure(0, weight=1)
+        self.root.grid_columnconfigure(0, weight=1)
+
+        # Only the entry column and notes row stretch
+        main_frame.grid_columnconfigure(1, weight=1)
+        main_frame.grid_columnconfigure(0, weight=0)
+        main_frame.grid_columnconfigure(2, weight=0)
+        main_frame.grid_rowconfigure(4, weight=1)
+
+        # Event bindings
+        self.company_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh_boards())
+        self.company_combo.bind('<KeyRelease>', self.on_company_change)
+        self.board_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh_notes())
+        self.notes_tree.bind('<Double-1>', lambda e: self.view_note())
+        self.user_id.bind('<FocusOut>', self.save_user_id)
+
+        # Keep the window usable
+        self.root.minsize(600, 400)
+
+    def on_company_change(self, event=None):
+        """Handle when company selection changes, including manual clearing"""
+        # Coalesce bursts of keystrokes into one refresh
+        if self._company_change_job:
+            self.root.after_cancel(self._company_change_job)
+        self._company_change_job = self.root.after(150, self._apply_company_change)
+
+    def _apply_company_change(self):
+        self._company_change_job = None
+        if not self.company_var.get():
+            self.refresh_boards()
+
+    def save_user_id(self, event=None):
+        # Bound to <FocusOut>; skip the disk write when nothing changed
+        user = self.user_id.get()
+        if user == self.settings.get('last_user'):
+            return
+        self.settings['last_user'] = user
+        self.save_user_settings()
+
+    def refresh_companies(self):
+        if self._companies_cache is None:
+            self._companies_cache = self.db.get_companies()
+        companies = self._companies_cache
+        self.companies_dict = {name: id_ for id_, name in companies}
+        # Iterating the dict directly skips the intermediate key-list copy
+        self.company_combo['values'] = tuple(self.companies_dict)
+
+    def refresh_boards(self):
+        # Reset the board selection
+        self.board_var.set('')
+        self.board_combo['values'] = []
+        self.boards_dict = {}
+
+        company_name = self.company_var.get()
+        if company_name and company_name in self.companies_dict:
+            # Load the boards for the selected company
+            self.board_combo['state'] = 'normal'
+            company_id = self.companies_dict[company_name]
+            boards = self._boards_cache.get(company_id)
+            if boards is None:
+                boards = self._boards_cache[company_id] = self.db.get_boards(company_id)
+            self.boards_dict = {identifier: id_ for id_, identifier in boards}
+            self.board_combo['values'] = tuple(self.boards_dict)
+        else:
+            # No valid company selected
+            self.board_combo['state'] = 'disabled'
+
+        # Refresh the notes for the new selection
+        self.refresh_notes()
+
+    def _clear_notes_tree(self):
+        # Skip the Tcl round-trip entirely when the tree is already empty
+        children = self.notes_tree.get_children('')
+        if children:
+            self.notes_tree.delete(*children)
+
+    def refresh_notes(self):
+        board_id = self.boards_dict.get(self.board_var.get())
+        if not board_id:
+            self._clear_notes_tree()
+            return
+
+        # Fetch on a worker thread and populate once the result is ready;
+        # only the newest pending fetch is allowed to fill the tree
+        future = self._pool.submit(self.db.get_notes, board_id)
+        self._notes_future = future
+        self._poll_future(future, self._populate_notes)
+
+    def _poll_future(self, future, callback, interval=20):
+        if future.done():
+            callback(future)
+        else:
+            self.root.after(interval, self._poll_future, future, callback, interval)
+
+    def _populate_notes(self, future):
+        if future is not self._notes_future:
+            return
+        notes = future.result()
+
+        self._clear_notes_tree()
+        # get_notes ships exactly the rendered columns, with the creator
+        # fallback and date formatting done in SQL
+        rows = [(note[0], (note[2], note[1], note[3], note[4])) for note in notes]
+
+        # Suspend the scrollbar callback during the bulk insert so Tk
+        # doesn't re-run it once per row
+        scroll = self.notes_tree.cget('yscrollcommand')
+        self.notes_tree.configure(yscrollcommand='')
+        try:
+            for iid, values in rows:
+                self.notes_tree.insert('', 'end', values=values, iid=iid)
+        finally:
+            self.notes_tree.configure(yscrollcommand=scroll)
+
+    def add_company_dialog(self):
+        dialog = BaseDialog(self.root, "Add Company")
+
+        ttk.Label(dialog, text="Company Name:").grid(row=0, column=0, padx=5, pady=5)
+        company_entry = ttk.Entry(dialog)
+        company_entry.grid(row=0, column=1, padx=5, pady=5)
+
+        def save():
+            company_name = company_entry.get().strip()
+            if company_name:
+                self.db.add_company(company_name)
+                self._companies_cache = None
+                self.refresh_companies()
+                dialog.destroy()
+
+        ttk.Button(dialog, text="Save", command=save).grid(row=1, column=0, columnspan=2, pady=10)
+
+    def delete_company_dialog(self):
+        company_name = self.company_var.get()
+        if not company_name:
+            messagebox.showwarning("Warning", "Please select a company to delete")
+            return
+
+        if messagebox.askyesno("Confirm Delete",
+                               f"Are you sure you want to delete the company '{company_name}'?\n\n" +
+                               "This will also delete all boards and notes associated with this company."):
+            company_id = self.companies_dict[company_name]
+            self.db.delete_company(company_id)
+            self._companies_cache = None
+            self._boards_cache.pop(company_id, None)
+            self.company_var.set('')
+            self.board_var.set('')
+            self.refresh_companies()
+            self.refresh_boards()
+            self.refresh_notes()
+
+    def delete_board_dialog(self):
+        board_identifier = self.board_var.get()
+        if not board_identifier:
+            messagebox.showwarning("Warning", "Please select a board to delete")
+            return
+
+        if messagebox.askyesno("Confirm Delete",
+                               f"Are you sure you want to delete the board '{board_identifier}'?\n\n" +
+                               "This will also delete all notes on this board."):
+            board_id = self.boards_dict[board_identifier]
+            self.db.delete_board(board_id)
+            self._boards_cache.pop(self.companies_dict.get(self.company_var.get()), None)
+            self.board_var.set('')
+            self.refresh_boards()
+            self.refresh_notes()
+
+    def add_board_dialog(self):
+        if not self.company_var.get():
+            messagebox.showwarning("Warning", "Please select a company first")
+            return
+
+        dialog = BaseDialog(self.root, "Add Board")
+
+        ttk.Label(dialog, text="Board Identifier:").grid(row=0, column=0, padx=5, pady=5)
+        board_entry = ttk.Entry(dialog)
+        board_entry.grid(row=0, column=1, padx=5, pady=5)
+
+        def save():
+            board_id = board_entry.get().strip()
+            if board_id:
+                company_id = self.companies_dict[self.company_var.get()]
+                self.db.add_board(company_id, board_id)
+                self._boards_cache.pop(company_id, None)
+                self.refresh_boards()
+                dialog.destroy()
+
+        ttk.Button(dialog, text="Save", command=save).grid(row=1, column=0, columnspan=2, pady=10)
+
+    def new_note_dialog(self):
+        if not self.user_id.get():
+            messagebox.showwarning("Warning", "Please enter a User ID")
+            return
+
+        if not self.company_var.get():
+            messagebox.showwarning("Warning", "Please select a Company")
+            return
+
+        board_identifier = self.board_var.get()
+        if not board_identifier or board_identifier not in self.boards_dict:
+            messagebox.showwarning("Warning", "Please select a valid Board")
+            return
+
+        self.edit_note_dialog(is_new=True)
+
+    def edit_note_dialog(self, is_new=False):
+        if not is_new and not self.notes_tree.selection():
+            messagebox.showwarning("Warning", "Please select a note to edit")
+            return
+
+        if is_new:
+            self._open_note_dialog(None, is_new=True)
+            return
+
+        # Fetch the full note (content included) on a worker thread, like
+        # the list fetch in refresh_notes, so a slow share doesn't freeze
+        # the UI between the click and the dialog
+        future = self._pool.submit(self.db.get_note, self.notes_tree.selection()[0])
+        self._poll_future(future, lambda f: self._open_note_dialog(f.result(), is_new=False))
+
+    def _open_note_dialog(self, note, is_new):
+        if not is_new and note is None:
+            # The note was deleted between the click and the fetch
+            self.refresh_notes()
+            return
+
+        def save():
+            title = dialog.title_entry.get().strip()
+            content = dialog.content_text.get(1.0, tk.END).strip()
+
+            if not title:
+                messagebox.showwarning("Warning", "Please enter a title")
+                return
+
+            if is_new:
+                board_id = self.boards_dict[self.board_var.get()]
+                self.db.add_note(board_id, self.user_id.get(), title, content)
+            else:
+                self.db.update_note(note[0], title, content, self.user_id.get())
+
+            self.refresh_notes()
+            dialog.destroy()
+
+        dialog = NoteDialog(
+            parent=self.root,
+            title="New Note" if is_new else "Edit Note",
+            app=self,
+            note=note,
+            is_readonly=False,
+            on_save=save
+        )
+
+    def view_note(self):
+        selected = self.notes_tree.selection()
+        if not selected:
+            return
+
+        future = self._pool.submit(self.db.get_note, selected[0])
+        self._poll_future(future, self._show_note_view)
+
+    def _show_note_view(self, future):
+        note = future.result()
+        if note:
+            dialog = NoteDialog(
+                self.root,
+                "View Note",
+                app=self,
+                note=note,
+                is_readonly=True,
+                on_edit=lambda: (dialog.destroy(), self.edit_note_dialog(is_new=False))
+            )
+
+    def delete_note(self):
+        selected = self.notes_tree.selection()
+        if not selected:
+            messagebox.showwarning("Warning", "Please select a note to delete")
+            return
+
+        if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this note?"):
+            note_id = selected[0]
+            self.db.delete_note(note_id)
+            self.refresh_notes()
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = NotesApp(root)
+    root.mainloop()
@@ -0,0 +1,617 @@
+import sqlite3
+from contextlib import contextmanager
+import functools
+import os
+import queue
+import threading
+import time
+import random
+import weakref
+
+# SQL for the hot note paths lives in module-level constants so every call
+# passes the same string object and sqlite3's statement cache always hits.
+# Epoch timestamps are written with strftime('%s', ...) rather than
+# unixepoch() (SQLite 3.38+) so the oldest library this module supports is
+# the pre-RETURNING 3.35 floor, not a newer one set by accident.
+_SQL_ADD_NOTE = '''
+    INSERT INTO notes (board_id, user_id, title, content, created_at, updated_at, last_modified_by)
+    VALUES (?, ?, ?, ?, strftime('%s', 'now'), strftime('%s', 'now'), ?)
+'''
+
+_SQL_UPDATE_NOTE = '''
+    UPDATE notes
+    SET title = ?, content = ?, updated_at = strftime('%s', 'now'), last_modified_by = ?, currently_editing = NULL
+    WHERE id = ?
+'''
+
+_SQL_DELETE_NOTE = 'DELETE FROM notes WHERE id = ?'
+
+# Only the columns the notes list actually renders; content stays on disk
+# until a note is opened via get_note
+_SQL_GET_NOTES = '''
+    SELECT id, user_id, title,
+           COALESCE(last_modified_by, user_id),
+           datetime(updated_at, 'unixepoch', 'localtime')
+    FROM notes
+    WHERE board_id = ?
+    ORDER BY updated_at DESC
+'''
+
+_SQL_GET_NOTE = '''
+    SELECT id, board_id, user_id, title, content,
+           datetime(created_at, 'unixepoch', 'localtime') AS created_at,
+           datetime(updated_at, 'unixepoch', 'localtime') AS updated_at,
+           last_modified_by
+    FROM notes
+    WHERE id = ?
+'''
+
+_SQL_GET_EDITING = 'SELECT currently_editing FROM notes WHERE id = ?'
+
+_SQL_SET_EDITING = (
+    'UPDATE notes SET currently_editing = ? '
+    'WHERE id = ? AND (currently_editing IS NULL OR currently_editing = ?)'
+)
+
+_SQL_CLEAR_EDITING = 'UPDATE notes SET currently_editing = NULL WHERE id = ? AND currently_editing = ?'
+
+# RETURNING needs SQLite 3.35+; older library builds take the
+# two-statement fallback in add_company/add_board
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_SQL_ADD_COMPANY = (
+    'INSERT INTO companies (name) VALUES (?) '
+    'ON CONFLICT(name) DO UPDATE SET name = excluded.name '
+    'RETURNING id'
+)
+
+_SQL_ADD_BOARD = (
+    'INSERT INTO boards (company_id, board_identifier) VALUES (?, ?) '
+    'ON CONFLICT(company_id, board_identifier) DO UPDATE SET board_identifier = excluded.board_identifier '
+    'RETURNING id'
+)
+
+_SQL_GET_COMPANIES = 'SELECT id, name FROM companies'
+
+_SQL_GET_BOARDS = 'SELECT id, board_identifier FROM boards WHERE company_id = ?'
+
+@functools.lru_cache(maxsize=None)
+def _ensure_db_dir(db_dir):
+    """Create the database directory once per path per process"""
+    os.makedirs(db_dir, exist_ok=True)
+
+# Per-thread Database cache used by get_db
+_tls = threading.local()
+
+def get_db(db_file="notes.db"):
+    """Return this thread's Database for db_file, creating it on first use"""
+    cache = getattr(_tls, 'databases', None)
+    if cache is None:
+        cache = _tls.databases = {}
+    db = cache.get(db_file)
+    if db is None:
+        db = cache[db_file] = Database(db_file)
+    return db
+
+def _checkpoint_worker(db_ref, stop_event, interval):
+    """Background WAL checkpoint loop
+
+    Takes a weak reference to the Database so the running thread doesn't
+    keep a forgotten instance alive; the loop ends when the stop event is
+    set or the instance has been collected.
+    """
+    while not stop_event.wait(interval):
+        db = db_ref()
+        if db is None:
+            return
+        db._checkpoint_once()
+
+def _cleanup(stop_event, readers, connection):
+    """Last-resort resource release for Database instances
+
+    Registered via weakref.finalize so it runs at garbage collection or
+    interpreter shutdown without resurrecting the instance; close() is
+    still the proper way to shut a Database down.
+    """
+    stop_event.set()
+    while True:
+        try:
+            readers.get_nowait().close()
+        except queue.Empty:
+            break
+        except Exception:
+            pass
+    if connection is not None:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+class Database:
+    MAX_RETRIES = 5
+    INITIAL_TIMEOUT = 20.0  # seconds; sqlite connect/busy timeout, not a sleep
+    BASE_BACKOFF = 0.05  # seconds
+    MAX_BACKOFF = 2.0  # seconds
+    RETRY_DEADLINE = 5.0  # seconds of total retry wall-time per operation
+    READER_POOL_SIZE = 4  # read-only connections; WAL readers never block each other
+    CHECKPOINT_INTERVAL = 60.0  # seconds between background WAL checkpoints
+
+    def __init__(self, db_file="notes.db"):
+        self.db_file = db_file
+        self.connection = None
+        # Read-only connections are created on demand up to
+        # READER_POOL_SIZE and parked here between SELECTs
+        self._readers = queue.Queue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
+        # Serializes writers inside this process; reentrant so statements
+        # issued within transaction() can retake it
+        self._write_lock = threading.RLock()
+        # Ensure the directory for the database exists; bare filenames have
+        # no directory component and need no syscall, and the cached helper
+        # skips the stat on repeat instantiations against the same path
+        db_dir = os.path.dirname(db_file)
+        if db_dir:
+            _ensure_db_dir(db_dir)
+        self._connect_with_retry()
+        self._create_tables()
+        # Fold the WAL back into the main file off the write path so user
+        # writes don't pay the checkpoint fsyncs
+        self._checkpoint_stop = threading.Event()
+        self._checkpoint_thread = None
+        if self._wal_enabled:
+            self._checkpoint_thread = threading.Thread(
+                target=_checkpoint_worker,
+                args=(weakref.ref(self), self._checkpoint_stop, self.CHECKPOINT_INTERVAL),
+                daemon=True, name='db-checkpoint')
+            self._checkpoint_thread.start()
+        # Safety net in case close() is never called; the callback holds
+        # the resources directly, not self, so it can't delay collection
+        self._finalizer = weakref.finalize(
+            self, _cleanup, self._checkpoint_stop, self._readers, self.connection)
+
+    def _connect_with_retry(self):
+        """Attempt to connect to database with retries and exponential backoff"""
+        retry_count = 0
+        last_error = None
+        sleep_time = self.BASE_BACKOFF
+
+        while retry_count < self.MAX_RETRIES:
+            try:
+                self._connect()
+                return
+            except Exception as e:
+                last_error = e
+                retry_count += 1
+                if retry_count < self.MAX_RETRIES:
+                    # Decorrelated jitter keeps concurrent clients from
+                    # retrying in lockstep
+                    sleep_time = random.uniform(self.BASE_BACKOFF, min(self.MAX_BACKOFF, sleep_time * 3))
+                    time.sleep(sleep_time)
+
+        # All retries exhausted
+        raise Exception(f"Failed to connect to database after {self.MAX_RETRIES} attempts. Last error: {str(last_error)}")
+
+    def _connect(self):
+        """Create a new database connection with timeout and write-ahead logging"""
+        try:
+            self._open()
+            self._configure()
+        except sqlite3.Error as e:
+            if self.connection:
+                try:
+                    self.connection.close()
+                except:
+                    pass
+            self.connection = None
+            raise Exception(f"Failed to connect to database at {self.db_file}: {str(e)}")
+
+    def _open(self):
+        """Open the raw writer connection"""
+        # Connect with a generous timeout for network shares and a larger
+        # prepared-statement cache for the repeated note queries.
+        # check_same_thread=False lets the GUI hand queries to a worker
+        # thread; writes stay serialized by the transaction layer.
+        # isolation_level=None turns off the driver's implicit BEGIN
+        # tracking — transactions are opened explicitly with
+        # BEGIN IMMEDIATE and everything else runs in true autocommit.
+        self.connection = sqlite3.connect(self.db_file, timeout=self.INITIAL_TIMEOUT,
+                                          cached_statements=256, check_same_thread=False,
+                                          isolation_level=None)
+
+    def _configure(self):
+        """Apply the file-database PRAGMAs; in-memory databases skip them"""
+        if self.db_file == ':memory:':
+            # WAL (and friends) don't apply to in-memory databases; the
+            # journal silently stays in MEMORY mode
+            self._wal_enabled = False
+            return
+
+        # A larger page size suits the blob-ish note content, but it only
+        # takes effect before the first page is written (and WAL freezes
+        # it), so apply it to brand-new databases only
+        if self.connection.execute('PRAGMA page_count').fetchone()[0] == 0:
+            self.connection.execute('PRAGMA page_size=8192')
+
+        # One parse pass for the whole connection setup: WAL for
+        # concurrent access, a 20 s busy wait, NORMAL sync (safe with
+        # WAL), in-memory temp tables, plus memory-mapped I/O and a
+        # 64 MiB page cache for the read paths. The autocheckpoint
+        # threshold is raised well above the default because the
+        # background checkpoint thread does the folding; it is only a
+        # safety valve against a runaway WAL.
+        self.connection.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA busy_timeout=20000;
+            PRAGMA foreign_keys=ON;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+            PRAGMA wal_autocheckpoint=10000;
+        ''')
+
+        # WAL can be silently refused (read-only media, some network
+        # filesystems); remember whether it actually took effect
+        mode = self.connection.execute('PRAGMA journal_mode').fetchone()[0]
+        self._wal_enabled = (mode.lower() == 'wal')
+
+    def execute_with_retry(self, operation, parameters=()):
+        """Execute a write statement on the shared writer connection
+
+        In-process writers queue on the write lock, and cross-process
+        contention is absorbed by busy_timeout inside the C layer, so no
+        Python-side busy retry is needed; only a closed connection is
+        recovered here, bounded by RETRY_DEADLINE.
+
+        Pass constant SQL strings (the module-level _SQL_* constants, not
+        f-strings built per call) so the connection's prepared-statement
+        cache can reuse the compiled statement.
+        """
+        deadline = time.monotonic() + self.RETRY_DEADLINE
+
+        while True:
+            try:
+                if not self.connection:
+                    self._connect_with_retry()
+
+                # Connection.execute reuses an internal cursor instead of
+                # allocating a new one per call; with isolation_level=None
+                # standalone statements commit natively, so no commit() call
+                with self._write_lock:
+                    return self.connection.execute(operation, parameters)
+
+            except sqlite3.ProgrammingError as e:
+                # The connection was closed underneath us — reconnect and
+                # try again; every other error propagates untouched
+                if 'closed database' in str(e) and time.monotonic() < deadline:
+                    self.connection = None
+                    continue
+                raise
+
+    def execute_read(self, operation, parameters=()):
+        """Fast path for SELECTs: no retry machinery and no commit
+
+        Reads under WAL never hit the write lock, and busy_timeout covers
+        transient contention inside the C layer.
+        """
+        if self.db_file == ':memory:':
+            # An in-memory database is private to the writer connection; a
+            # mode=ro URI would open a separate, empty one. The connection
+            # is serialized, so reading without the write lock is safe.
+            return self.connection.execute(operation, parameters)
+        reader = self._acquire_reader()
+        try:
+            # The cursor stays valid after the connection goes back into
+            # the pool: sqlite3 connections run in serialized threading
+            # mode, so overlapping cursors on one reader are safe
+            return reader.execute(operation, parameters)
+        finally:
+            self._release_reader(reader)
+
+    def _acquire_reader(self):
+        """Check a read-only connection out of the pool, growing it lazily
+
+        Opened on demand: the database file only exists once the writer
+        connection has created it, and most sessions never need all
+        READER_POOL_SIZE connections.
+        """
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._reader_lock:
+            if self._reader_count < self.READER_POOL_SIZE:
+                self._reader_count += 1
+                reader = sqlite3.connect(f'file:{self.db_file}?mode=ro', uri=True,
+                                         timeout=self.INITIAL_TIMEOUT, cached_statements=256,
+                                         check_same_thread=False)
+                # Same tuning as the writer where it matters for SELECTs —
+                # page cache and mmap are per-connection, so the reader pool
+                # needs its own. mode=ro already rejects writes; query_only
+                # also covers anything that would touch temp state.
+                reader.executescript('''
+                    PRAGMA busy_timeout=20000;
+                    PRAGMA temp_store=MEMORY;
+                    PRAGMA mmap_size=268435456;
+                    PRAGMA cache_size=-65536;
+                    PRAGMA query_only=ON;
+                ''')
+                return reader
+        # Pool is at capacity and every reader is checked out — wait for one
+        return self._readers.get()
+
+    def _release_reader(self, reader):
+        """Return a read-only connection to the pool"""
+        self._readers.put(reader)
+
+    def _checkpoint_once(self):
+        """One background checkpoint pass, folding the WAL into the main file
+
+        Called from the daemon checkpoint thread so the fsyncs happen
+        between user writes instead of inside them.
+        """
+        with self._write_lock:
+            if not self.connection:
+                return
+            try:
+                self.connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            except sqlite3.Error:
+                # Busy checkpoints are fine — the next pass retries
+                pass
+
+    @contextmanager
+    def transaction(self):
+        """Group related writes into a single transaction with one commit"""
+        with self._write_lock:
+            try:
+                # Take the database write lock up front so the transaction
+                # can't fail midway
+                self.execute_with_retry('BEGIN IMMEDIATE')
+                yield
+                self.connection.commit()
+            except Exception:
+                self.connection.rollback()
+                raise
+
+    def _create_tables(self):
+        """Create database tables if they don't exist"""
+        with self.transaction():
+            self.execute_with_retry('''
+                CREATE TABLE IF NOT EXISTS companies (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT UNIQUE NOT NULL
+                )
+            ''')
+
+            self.execute_with_retry('''
+                CREATE TABLE IF NOT EXISTS boards (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    company_id INTEGER,
+                    board_identifier TEXT NOT NULL,
+                    FOREIGN KEY (company_id) REFERENCES companies (id) ON DELETE CASCADE,
+                    UNIQUE(company_id, board_identifier)
+                )
+            ''')
+
+            self.execute_with_retry('''
+                CREATE TABLE IF NOT EXISTS notes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    board_id INTEGER,
+                    user_id TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    content TEXT,
+                    created_at INTEGER NOT NULL DEFAULT (strftime('%s', 'now')),
+                    updated_at INTEGER NOT NULL DEFAULT (strftime('%s', 'now')),
+                    last_modified_by TEXT,
+                    currently_editing TEXT,
+                    FOREIGN KEY (board_id) REFERENCES boards (id) ON DELETE CASCADE
+                )
+            ''')
+
+            # One-time migration for databases written before the epoch
+            # switch: legacy rows hold TEXT 'YYYY-MM-DD HH:MM:SS' values,
+            # which datetime(..., 'unixepoch') cannot format and which sort
+            # above every INTEGER, pinning old notes to the top of the list
+            self.execute_with_retry('''
+                UPDATE notes
+                SET created_at = strftime('%s', created_at),
+                    updated_at = strftime('%s', updated_at)
+                WHERE typeof(updated_at) = 'text'
+            ''')
+
+            # Covering index for the notes list: ordered walk plus every
+            # selected column, so the query never touches the row B-tree
+            # (and so never reads past the large content blobs). Supersedes
+            # the narrower idx_notes_board_updated.
+            self.execute_with_retry('DROP INDEX IF EXISTS idx_notes_board_updated')
+            self.execute_with_retry('''
+                CREATE INDEX IF NOT EXISTS idx_notes_list
+                ON notes (board_id, updated_at DESC, id, user_id, title, last_modified_by)
+            ''')
+            self.execute_with_retry('CREATE INDEX IF NOT EXISTS idx_boards_company ON boards (company_id)')
+
+            # Partial index for editor-presence lookups: only notes being
+            # edited right now appear in it, so it stays tiny no matter how
+            # many notes accumulate
+            self.execute_with_retry('''
+                CREATE INDEX IF NOT EXISTS idx_notes_editing
+                ON notes (currently_editing) WHERE currently_editing IS NOT NULL
+            ''')
+
+            # Refresh planner statistics so the composite index is picked
+            # for the ordered note listing
+            self.execute_with_retry('ANALYZE')
+
+    def clear_all_data(self):
+        """Clear all data from the database"""
+        # Once BEGIN IMMEDIATE has the write lock the retry wrapper adds
+        # nothing, so run the statements directly on the connection
+        with self.transaction():
+            conn = self.connection
+            conn.execute('DELETE FROM notes')
+            conn.execute('DELETE FROM boards')
+            conn.execute('DELETE FROM companies')
+            conn.execute('UPDATE sqlite_sequence SET seq = 0')
+
+    def add_company(self, company_name):
+        # Insert-or-fetch in one statement: the no-op update makes the
+        # conflicting row visible to RETURNING
+        with self.transaction():
+            if _HAS_RETURNING:
+                result = self.execute_with_retry(_SQL_ADD_COMPANY, (company_name,)).fetchone()
+            else:
+                self.execute_with_retry('INSERT OR IGNORE INTO companies (name) VALUES (?)', (company_name,))
+                result = self.execute_with_retry('SELECT id FROM companies WHERE name = ?', (company_name,)).fetchone()
+        return result[0]
+
+    def add_board(self, company_id, board_identifier):
+        with self.transaction():
+            if _HAS_RETURNING:
+                result = self.execute_with_retry(_SQL_ADD_BOARD, (company_id, board_identifier)).fetchone()
+            else:
+                self.execute_with_retry(
+                    'INSERT OR IGNORE INTO boards (company_id, board_identifier) VALUES (?, ?)',
+                    (company_id, board_identifier)
+                )
+                result = self.execute_with_retry(
+                    'SELECT id FROM boards WHERE company_id = ? AND board_identifier = ?',
+                    (company_id, board_identifier)
+                ).fetchone()
+        return result[0]
+
+    def add_note(self, board_id, user_id, title, content):
+        # created_at/updated_at are set in SQL; spelled out in the INSERT
+        # rather than left to the column defaults because databases created
+        # by the original schema have none
+        with self.transaction():
+            result = self.execute_with_retry(
+                _SQL_ADD_NOTE,
+                (board_id, user_id, title, content, user_id)
+            )
+            note_id = result.lastrowid
+        return note_id
+
+    def add_notes(self, board_id, rows):
+        """Bulk-insert notes for a board in one transaction
+
+        rows is an iterable of (user_id, title, content) tuples.
+        Returns the number of notes inserted.
+        """
+        with self.transaction():
+            cursor = self.connection.executemany(
+                _SQL_ADD_NOTE,
+                ((board_id, user_id, title, content, user_id)
+                 for user_id, title, content in rows)
+            )
+            return cursor.rowcount
+
+    def update_note(self, note_id, title, content, user_id):
+        with self.transaction():
+            self.execute_with_retry(_SQL_UPDATE_NOTE, (title, content, user_id, note_id))
+
+    def delete_note(self, note_id):
+        with self.transaction():
+            self.execute_with_retry(_SQL_DELETE_NOTE, (note_id,))
+
+    def delete_board(self, board_id):
+        """Delete a board and all its associated notes"""
+        with self.transaction():
+            self.execute_with_retry('DELETE FROM notes WHERE board_id = ?', (board_id,))
+            self.execute_with_retry('DELETE FROM boards WHERE id = ?', (board_id,))
+
+    def delete_company(self, company_id):
+        """Delete a company and all its associated boards and notes"""
+        # The explicit child deletes keep databases created before the
+        # ON DELETE CASCADE schema consistent; with cascade they are no-ops
+        with self.transaction():
+            self.execute_with_retry(
+                'DELETE FROM notes WHERE board_id IN (SELECT id FROM boards WHERE company_id = ?)',
+                (company_id,)
+            )
+            self.execute_with_retry('DELETE FROM boards WHERE company_id = ?', (company_id,))
+            self.execute_with_retry('DELETE FROM companies WHERE id = ?', (company_id,))
+
+    def get_companies(self):
+        return self.execute_read(_SQL_GET_COMPANIES).fetchall()
+
+    def get_boards(self, company_id):
+        return self.execute_read(_SQL_GET_BOARDS, (company_id,)).fetchall()
+
+    def iter_notes(self, board_id):
+        """Iterate a board's notes without materializing every row up front"""
+        return self.execute_read(_SQL_GET_NOTES, (board_id,))
+
+    def get_notes(self, board_id):
+        return list(self.iter_notes(board_id))
+
+    def get_note(self, note_id):
+        return self.execute_read(_SQL_GET_NOTE, (note_id,)).fetchone()
+
+    def set_note_editing_status(self, note_id, user_id):
+        """Returns True if successfully set editing status, False if someone else is editing"""
+        # Claim the lock in one conditional UPDATE so two users can't race
+        # between a read and a write
+        with self.transaction():
+            result = self.execute_with_retry(_SQL_SET_EDITING, (user_id, note_id, user_id))
+            claimed = bool(result.rowcount)
+        if claimed:
+            return True, None
+
+        # Lost the claim — look up who holds the note
+        holder = self.execute_read(_SQL_GET_EDITING, (note_id,)).fetchone()
+        return False, holder[0] if holder else None
+
+    def clear_note_editing_status(self, note_id, user_id):
+        """Clear editing status only if this user was the editor"""
+        with self.transaction():
+            self.execute_with_retry(_SQL_CLEAR_EDITING, (note_id, user_id))
+
+    def get_note_editing_status(self, note_id):
+        """Returns who is currently editing the note, if anyone"""
+        result = self.execute_read(_SQL_GET_EDITING, (note_id,)).fetchone()
+        return result[0] if result else None
+
+    def close(self):
+        """Close the database connections"""
+        # Everything below is handled explicitly, so the GC safety net
+        # has nothing left to do
+        if getattr(self, '_finalizer', None):
+            self._finalizer.detach()
+        # Stop the background checkpointer before the final checkpoint
+        # below; the thread is daemonized, so the join is just courtesy
+        self._checkpoint_stop.set()
+        if self._checkpoint_thread:
+            self._checkpoint_thread.join(timeout=1.0)
+            self._checkpoint_thread = None
+        # Drain the reader pool; connections still checked out are closed
+        # by interpreter shutdown
+        with self._reader_lock:
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+                except:
+                    pass
+            self._reader_count = 0
+        if self.connection:
+            try:
+                # Keep planner statistics current for the next session,
+                # then fold the WAL back into the main file so it doesn't
+                # grow unbounded and the next open has nothing to replay
+                self.connection.execute('PRAGMA optimize')
+                self.connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            except:
+                pass
+            try:
+                self.connection.close()
+            except:
+                pass
+            self.connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,248 @@
+import tkinter as tk
+from app import NotesApp
+import threading
+import time
+import unittest
+from database import Database, get_db
+import json
+from pathlib import Path
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+class TestNotesApp(unittest.TestCase):
+    def setUp(self):
+        # Remove leftovers from previous runs; unlink(missing_ok=True)
+        # skips the separate existence check
+        for leftover in ('test_notes.db', 'test_notes.db-wal',
+                         'test_notes.db-shm', 'test_settings.json'):
+            try:
+                Path(leftover).unlink(missing_ok=True)
+            except PermissionError:
+                pass
+
+        # Use a dedicated test database
+        self.db = Database('test_notes.db')
+        # Start from a clean slate
+        self.db.clear_all_data()
+
+    def tearDown(self):
+        # Close connections before removing files; close() releases the
+        # handles synchronously so no settling delay is needed
+        if self.db:
+            self.db.close()
+        # Remove the WAL sidecar files along with the database itself
+        for leftover in ('test_notes.db', 'test_notes.db-wal',
+                         'test_notes.db-shm', 'test_settings.json'):
+            try:
+                Path(leftover).unlink(missing_ok=True)
+            except PermissionError:
+                pass
+
+    def test_individual_company_operations(self):
+        """Test individual company operations"""
+        # Add a company
+        company_id = self.db.add_company("Test Company")
+        self.assertIsNotNone(company_id)
+
+        # Verify it shows up
+        companies = self.db.get_companies()
+        self.assertEqual(len(companies), 1)
+        self.assertEqual(companies[0][1], "Test Company")
+
+        # Delete it again
+        self.db.delete_company(company_id)
+        companies = self.db.get_companies()
+        self.assertEqual(len(companies), 0)
+
+    def test_individual_board_operations(self):
+        """Test individual board operations"""
+        company_id = self.db.add_company("Test Company")
+
+        # Add a board
+        board_id = self.db.add_board(company_id, "Test Board")
+        self.assertIsNotNone(board_id)
+
+        # Verify it shows up
+        boards = self.db.get_boards(company_id)
+        self.assertEqual(len(boards), 1)
+        self.assertEqual(boards[0][1], "Test Board")
+
+        # Delete it again
+        self.db.delete_board(board_id)
+        boards = self.db.get_boards(company_id)
+        self.assertEqual(len(boards), 0)
+
+    def test_individual_note_operations(self):
+        """Test individual note operations"""
+        company_id = self.db.add_company("Test Company")
+        board_id = self.db.add_board(company_id, "Test Board")
+
+        # Add a note
+        note_id = self.db.add_note(board_id, "user1", "Test Note", "Test Content")
+        self.assertIsNotNone(note_id)
+
+        # Read it back
+        note = self.db.get_note(note_id)
+        self.assertEqual(note[3], "Test Note")
+        self.assertEqual(note[4], "Test Content")
+
+        # Update it
+        self.db.update_note(note_id, "Updated Note", "Updated Content", "user1")
+        updated_note = self.db.get_note(note_id)
+        self.assertEqual(updated_note[3], "Updated Note")
+        self.assertEqual(updated_note[4], "Updated Content")
+
+        # Delete it
+        self.db.delete_note(note_id)
+        notes = self.db.get_notes(board_id)
+        self.assertEqual(len(notes), 0)
+
+    def test_concurrent_note_editing(self):
+        """Test concurrent note editing between multiple users"""
+        # Set up a note to fight over
+        company_id = self.db.add_company("Test Company")
+        board_id = self.db.add_board(company_id, "Test Board")
+        note_id = self.db.add_note(board_id, "user1", "Test Note", "Initial content")
+
+        # First user starts editing
+        success1, editor = self.db.set_note_editing_status(note_id, "user1")
+        self.assertTrue(success1)
+        self.assertIsNone(editor)
+
+        # Second user is locked out
+        success2, editor = self.db.set_note_editing_status(note_id, "user2")
+        self.assertFalse(success2)
+        self.assertEqual(editor, "user1")
+
+        # First user finishes
+        self.db.clear_note_editing_status(note_id, "user1")
+
+        # Now the second user can edit
+        success3, editor = self.db.set_note_editing_status(note_id, "user2")
+        self.assertTrue(success3)
+        self.assertIsNone(editor)
+
+    def test_concurrent_company_board_creation(self):
+        """Test concurrent creation of companies and boards"""
+        def add_companies(user_id, companies):
+            # Reuse the worker thread's connection instead of opening a new one
+            db = get_db('test_notes.db')
+            company_ids = []
+            for company in companies:
+                company_id = db.add_company(company)
+                company_ids.append((company, company_id))
+            return company_ids
+
+        # Two users adding different companies at the same time
+        companies1 = ["Company A", "Company B"]
+        companies2 = ["Company C", "Company D"]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future1 = executor.submit(add_companies, "user1", companies1)
+            future2 = executor.submit(add_companies, "user2", companies2)
+
+            # Wait for both to finish
+            results1 = future1.result()
+            results2 = future2.result()
+
+        # All four companies should exist exactly once
+        companies = self.db.get_companies()
+        self.assertEqual(len(companies), 4)
+        company_names = {company[1] for company in companies}
+        self.assertEqual(company_names, {"Company A", "Company B", "Company C", "Company D"})
+
+    def test_concurrent_note_creation(self):
+        """Test concurrent creation of notes"""
+        company_id = self.db.add_company("Test Company")
+        board_id = self.db.add_board(company_id, "Test Board")
+
+        def create_notes(user_id, num_notes):
+            db = get_db('test_notes.db')
+            # One transaction per worker instead of one commit per note
+            db.add_notes(board_id, [
+                (user_id, f"Note {i} by {user_id}", f"Content {i}")
+                for i in range(num_notes)
+            ])
+
+        # Three users creating notes simultaneously
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(create_notes, "user1", 5),
+                executor.submit(create_notes, "user2", 5),
+                executor.submit(create_notes, "user3", 5)
+            ]
+
+            for future in as_completed(futures):
+                future.result()
+
+        # All notes should have been created
+        notes = self.db.get_notes(board_id)
+        self.assertEqual(len(notes), 15)
+
+        # Each user should have created exactly 5 (stream the rows rather
+        # than building a second list)
+        user_notes = {"user1": 0, "user2": 0, "user3": 0}
+        for note in self.db.iter_notes(board_id):
+            user_notes[note[1]] += 1
+
+        self.assertEqual(user_notes["user1"], 5)
+        self.assertEqual(user_notes["user2"], 5)
+        self.assertEqual(user_notes["user3"], 5)
+
+    def test_editing_status_cleared_on_save(self):
+        """Test that editing status is properly cleared when saving a note"""
+        company_id = self.db.add_company("Test Company")
+        board_id = self.db.add_board(company_id, "Test Board")
+        note_id = self.db.add_note(board_id, "user1", "Test Note", "Initial content")
+
+        # Start editing
+        success, _ = self.db.set_note_editing_status(note_id, "user1")
+        self.assertTrue(success)
+
+        # Saving should clear the editing flag
+        self.db.update_note(note_id, "Updated Title", "Updated content", "user1")
+
+        # Another user can now claim the note
+        success, editor = self.db.set_note_editing_status(note_id, "user2")
+        self.assertTrue(success)
+        self.assertIsNone(editor)
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up any test-wide resources"""
+        # A single hidden Tk root for the GUI tests
+        cls.root = tk.Tk()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up test-wide resources"""
+        cls.root.destroy()
+
+    def test_user_settings_persistence(self):
+        """Test that user settings are properly persisted"""
+        # Seed a settings file
+        settings = {"last_user": "test_user"}
+        with open('test_settings.json', 'w') as f:
+            json.dump(settings, f)
+
+        # The app should pick up the saved settings
+        app = NotesApp(self.root, settings_file='test_settings.json')
+
+        # Verify the settings were loaded
+        self.assertEqual(app.settings.get('last_user'), 'test_user')
+
+        # Change the user and save
+        app.user_id.delete(0, tk.END)
+        app.user_id.insert(0, 'new_user')
+        app.save_user_id()
+
+        # The new user should be written back to disk
+        with open('test_settings.json', 'r') as f:
+            updated_settings = json.load(f)
+        self.assertEqual(updated_settings.get('last_user'), 'new_user')
+
+def main():
+    unittest.main()
+
+if __name__ == "__main__":
+    main()